@@ -10,6 +10,34 @@ class ModuleTypeOFT(network.ModuleType):
 
         return None
 
+
+def cayley_general(block_Q, eye):
+    # (I + Q) and (I - Q)^-1 commute, so the Cayley transform is a single batched solve
+    return torch.linalg.solve((eye - block_Q).float(), (eye + block_Q).float())
+
+
+def cayley_bs2(block_Q, eye):
+    """Closed form of cayley_general for 2x2 blocks: Q = [[0, a], [-a, 0]] maps to a plain rotation."""
+
+    a = block_Q[..., 0, 1].float()
+    s = 1 / (1 + a * a)
+    cos = (1 - a * a) * s
+    sin = 2 * a * s
+    return torch.stack([torch.stack([cos, sin], dim=-1), torch.stack([-sin, cos], dim=-1)], dim=-2)
+
+
+def oft_rotation(oft_blocks, eye, constraint, cayley=cayley_general):
+    """Builds the block rotation R = (I + Q)(I - Q)^-1 from raw oft_blocks, with Q's norm clamped to constraint."""
+
+    block_Q = oft_blocks - oft_blocks.transpose(-1, -2) # ensure skew-symmetric orthogonal matrix
+    if constraint != 0:
+        norm_Q = torch.linalg.vector_norm(block_Q)
+        new_norm_Q = torch.clamp(norm_Q, max=constraint.to(oft_blocks.device))
+        block_Q.mul_((new_norm_Q + 1e-8) / (norm_Q + 1e-8)) # block_Q is a fresh tensor, safe to scale in place
+
+    return cayley(block_Q, eye)
+
+
 # Supports both kohya-ss' implementation of COFT  https://github.com/kohya-ss/sd-scripts/blob/main/networks/oft.py
 # and KohakuBlueleaf's implementation of OFT/COFT https://github.com/KohakuBlueleaf/LyCORIS/blob/dev/lycoris/modules/diag_oft.py
 class NetworkModuleOFT(network.NetworkModule):
@@ -67,29 +95,50 @@ class NetworkModuleOFT(network.NetworkModule):
             self.block_size = self.oft_blocks.shape[2]
             self.boft_b = self.block_size
 
-    def calc_updown(self, orig_weight):
-        oft_blocks = self.oft_blocks.to(orig_weight.device)
-        eye = torch.eye(self.block_size, device=oft_blocks.device)
+        self.cayley = cayley_bs2 if self.oft_blocks.shape[-1] == 2 else cayley_general
+
+        # R only depends on oft_blocks and the target device, so it is reused until either changes
+        self._cached_R = None
+        self._cache_key = None
+        self._eye = {}
+
+    def get_eye(self, device, dtype):
+        key = (device, dtype)
+        eye = self._eye.get(key)
+        if eye is None:
+            eye = torch.eye(self.block_size, device=device, dtype=dtype)
+            self._eye[key] = eye
+
+        return eye
+
+    def calc_R(self, device):
+        key = (self.oft_blocks.data_ptr(), self.oft_blocks._version, device)
+        if self._cache_key == key:
+            return self._cached_R
+
+        oft_blocks = self.oft_blocks.to(device)
+        eye = self.get_eye(oft_blocks.device, oft_blocks.dtype)
 
         if not self.is_R:
-            block_Q = oft_blocks - oft_blocks.transpose(-1, -2) # ensure skew-symmetric orthogonal matrix
-            if self.constraint != 0:
-                norm_Q = torch.norm(block_Q.flatten())
-                new_norm_Q = torch.clamp(norm_Q, max=self.constraint.to(oft_blocks.device))
-                block_Q = block_Q * ((new_norm_Q + 1e-8) / (norm_Q + 1e-8))
-            oft_blocks = torch.matmul(eye + block_Q, (eye - block_Q).float().inverse())
+            oft_blocks = oft_rotation(oft_blocks, eye, self.constraint, self.cayley)
+
+        self._cached_R = oft_blocks.to(device)
+        self._cache_key = key
+        return self._cached_R
+
+    def calc_updown(self, orig_weight):
+        if self.multiplier() == 0:
+            # finalize_updown scales by the multiplier, so the rotation would be discarded anyway
+            return self.finalize_updown(torch.zeros_like(orig_weight), orig_weight, orig_weight.shape)
 
-        R = oft_blocks.to(orig_weight.device)
+        R = self.calc_R(orig_weight.device)
 
         if not self.is_boft:
             # This errors out for MultiheadAttention, might need to be handled up-stream
-            merged_weight = rearrange(orig_weight, '(k n) ... -> k n ...', k=self.num_blocks, n=self.block_size)
-            merged_weight = torch.einsum(
-                'k n m, k n ... -> k m ...',
-                R,
-                merged_weight
-            )
-            merged_weight = rearrange(merged_weight, 'k m ... -> (k m) ...')
+            # R stays in block form: (k, n, m)^T @ (k, n, rest) rotates each block of rows without a dense block_diag
+            merged_weight = orig_weight.reshape(self.num_blocks, self.block_size, -1)
+            merged_weight = torch.bmm(R.transpose(1, 2), merged_weight)
+            merged_weight = merged_weight.reshape(orig_weight.shape)
         else:
             # TODO: determine correct value for scale
             scale = 1.0
@@ -101,7 +150,7 @@ class NetworkModuleOFT(network.NetworkModule):
                 bi = R[i] # b_num, b_size, b_size
                 if i == 0:
                     # Apply multiplier/scale and rescale into first weight
-                    bi = bi * scale + (1 - scale) * eye
+                    bi = bi * scale + (1 - scale) * self.get_eye(bi.device, bi.dtype)
                 inp = rearrange(inp, "(c g k) ... -> (c k g) ...", g=2, k=2**i * r_b)
                 inp = rearrange(inp, "(d b) ... -> d b ...", b=b)
                 inp = torch.einsum("b i j, b j ... -> b i ...", bi, inp)
@@ -1,4 +1,5 @@
-from functools import wraps
+from functools import wraps, partial
+import asyncio
 import html
 import time
 
@@ -17,7 +18,44 @@ def wrap_queued_call(func):
     return f
 
 
-def wrap_gradio_gpu_call(func, extra_outputs=None):
+def wrap_async(func):
+    """Wraps a blocking function into a coroutine function that awaits it on a worker thread, so that the caller's event loop is not blocked"""
+
+    @wraps(func)
+    async def f(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    return f
+
+
+def debounce(func, delay):
+    """Wraps a blocking function into a coroutine function that only runs it if no other call came in within delay seconds.
+
+    Calls that are superseded this way return None, so this is only meant for event handlers that have no outputs.
+    """
+
+    latest_call = 0
+    run = wrap_async(func)
+
+    @wraps(func)
+    async def f(*args, **kwargs):
+        nonlocal latest_call
+
+        # all calls run on the same event loop, so the counter needs no lock
+        latest_call += 1
+        call = latest_call
+
+        await asyncio.sleep(delay)
+        if call != latest_call:
+            return None
+
+        return await run(*args, **kwargs)
+
+    return f
+
+
+def wrap_gradio_gpu_call(func, extra_outputs=None, run_async=False):
     @wraps(func)
     def f(*args, **kwargs):
 
@@ -42,7 +80,9 @@ def wrap_gradio_gpu_call(func, extra_outputs=None):
 
         return res
 
-    return wrap_gradio_call(f, extra_outputs=extra_outputs, add_stats=True)
+    res = wrap_gradio_call(f, extra_outputs=extra_outputs, add_stats=True)
+
+    return wrap_async(res) if run_async else res
 
 
 def wrap_gradio_call(func, extra_outputs=None, add_stats=False):
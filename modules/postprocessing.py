@@ -1,4 +1,6 @@
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image
 
@@ -6,6 +8,49 @@ from modules import shared, images, devices, scripts, scripts_postprocessing, ui
 from modules.shared import opts
 
 
+def prefetch(func, iterable, executor, count):
+    """Like zip(iterable, map(func, iterable)), but func is run in executor for up to count items ahead of the one being consumed."""
+
+    pending = deque()
+    for item in iterable:
+        pending.append((item, executor.submit(func, item)))
+        if len(pending) > count:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+def save_postprocessed_image(pp, outpath, basename, infotext, existing_pnginfo, forced_filename, suffix):
+    fullfn, _ = images.save_image(pp.image, path=outpath, basename=basename, extension=opts.samples_format, info=infotext, short_filename=True, no_prompt=True, grid=False, pnginfo_section_name="extras", existing_info=existing_pnginfo, forced_filename=forced_filename, suffix=suffix)
+
+    if pp.caption:
+        caption_filename = os.path.splitext(fullfn)[0] + ".txt"
+        existing_caption = ""
+        try:
+            with open(caption_filename, encoding="utf8") as file:
+                existing_caption = file.read().strip()
+        except FileNotFoundError:
+            pass
+
+        action = shared.opts.postprocessing_existing_caption_action
+        if action == 'Prepend' and existing_caption:
+            caption = f"{existing_caption} {pp.caption}"
+        elif action == 'Append' and existing_caption:
+            caption = f"{pp.caption} {existing_caption}"
+        elif action == 'Keep' and existing_caption:
+            caption = existing_caption
+        else:
+            caption = pp.caption
+
+        caption = caption.strip()
+        if caption:
+            with open(caption_filename, "w", encoding="utf8") as file:
+                file.write(caption)
+
+
 def run_postprocessing(extras_mode, image, image_folder, input_dir, output_dir, show_extras_results, *args, save_output: bool = True):
     devices.torch_gc()
 
@@ -20,7 +65,8 @@ def run_postprocessing(extras_mode, image, image_folder, input_dir, output_dir,
                     image = images.fix_image(img)
                     fn = ''
                 else:
-                    image = images.read(os.path.abspath(img.name))
+                    # gradio has already stored the upload on disk; pass the path so that it is read like in the directory mode
+                    image = os.path.abspath(img.name)
                     fn = os.path.splitext(img.orig_name)[0]
                 yield image, fn
         elif extras_mode == 2:
@@ -44,83 +90,90 @@ def run_postprocessing(extras_mode, image, image_folder, input_dir, output_dir,
     data_to_process = list(get_images(extras_mode, image, image_folder, input_dir))
     shared.state.job_count = len(data_to_process)
 
-    for image_placeholder, name in data_to_process:
-        image_data: Image.Image
+    def read_image(data):
+        image_placeholder, _ = data
+        if not isinstance(image_placeholder, str):
+            return image_placeholder
+
+        try:
+            return images.read(image_placeholder)
+        except Exception:
+            return None
+
+    # For batches, upcoming images are read and finished ones are saved in background threads while the GPU works.
+    # Saving uses a single thread, so that files are written and numbered in order; like reads, at most io_threads saves are
+    # left pending, so that finished images do not pile up in memory and a failed save stops the batch early.
+    io_threads = opts.postprocessing_io_threads if extras_mode != 0 else 0
+    read_executor = ThreadPoolExecutor(max_workers=io_threads, thread_name_prefix="postprocessing_read") if io_threads > 0 else None
+    save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="postprocessing_save") if io_threads > 0 else None
+    save_futures = deque()
+
+    if read_executor is not None:
+        data_with_images = prefetch(read_image, data_to_process, read_executor, io_threads)
+    else:
+        data_with_images = ((data, read_image(data)) for data in data_to_process)
 
-        shared.state.nextjob()
-        shared.state.textinfo = name
-        shared.state.skipped = False
+    try:
+        for (_, name), image_data in data_with_images:
+            shared.state.nextjob()
+            shared.state.textinfo = name
+            shared.state.skipped = False
 
-        if shared.state.interrupted:
-            break
+            if shared.state.interrupted:
+                break
 
-        if isinstance(image_placeholder, str):
-            try:
-                image_data = images.read(image_placeholder)
-            except Exception:
+            if image_data is None:
                 continue
-        else:
-            image_data = image_placeholder
 
-        parameters, existing_pnginfo = images.read_info_from_image(image_data)
-        if parameters:
-            existing_pnginfo["parameters"] = parameters
+            parameters, existing_pnginfo = images.read_info_from_image(image_data)
+            if parameters:
+                existing_pnginfo["parameters"] = parameters
 
-        initial_pp = scripts_postprocessing.PostprocessedImage(image_data if image_data.mode in ("RGBA", "RGB") else image_data.convert("RGB"))
+            initial_pp = scripts_postprocessing.PostprocessedImage(image_data if image_data.mode in ("RGBA", "RGB") else image_data.convert("RGB"))
 
-        scripts.scripts_postproc.run(initial_pp, args)
+            scripts.scripts_postproc.run(initial_pp, args)
 
-        if shared.state.skipped:
-            continue
-
-        used_suffixes = {}
-        for pp in [initial_pp, *initial_pp.extra_images]:
-            suffix = pp.get_suffix(used_suffixes)
-
-            if opts.use_original_name_batch and name is not None:
-                basename = os.path.splitext(os.path.basename(name))[0]
-                forced_filename = basename + suffix
-            else:
-                basename = ''
-                forced_filename = None
+            if shared.state.skipped:
+                continue
 
-            infotext = ", ".join([k if k == v else f'{k}: {infotext_utils.quote(v)}' for k, v in pp.info.items() if v is not None])
+            used_suffixes = {}
+            for pp in [initial_pp, *initial_pp.extra_images]:
+                suffix = pp.get_suffix(used_suffixes)
 
-            if opts.enable_pnginfo:
-                pp.image.info = existing_pnginfo
-                pp.image.info["postprocessing"] = infotext
+                if opts.use_original_name_batch and name is not None:
+                    basename = os.path.splitext(os.path.basename(name))[0]
+                    forced_filename = basename + suffix
+                else:
+                    basename = ''
+                    forced_filename = None
 
-            shared.state.assign_current_image(pp.image)
+                infotext = ", ".join([k if k == v else f'{k}: {infotext_utils.quote(v)}' for k, v in pp.info.items() if v is not None])
 
-            if save_output:
-                fullfn, _ = images.save_image(pp.image, path=outpath, basename=basename, extension=opts.samples_format, info=infotext, short_filename=True, no_prompt=True, grid=False, pnginfo_section_name="extras", existing_info=existing_pnginfo, forced_filename=forced_filename, suffix=suffix)
+                if opts.enable_pnginfo:
+                    pp.image.info = existing_pnginfo
+                    pp.image.info["postprocessing"] = infotext
 
-                if pp.caption:
-                    caption_filename = os.path.splitext(fullfn)[0] + ".txt"
-                    existing_caption = ""
-                    try:
-                        with open(caption_filename, encoding="utf8") as file:
-                            existing_caption = file.read().strip()
-                    except FileNotFoundError:
-                        pass
+                shared.state.assign_current_image(pp.image)
 
-                    action = shared.opts.postprocessing_existing_caption_action
-                    if action == 'Prepend' and existing_caption:
-                        caption = f"{existing_caption} {pp.caption}"
-                    elif action == 'Append' and existing_caption:
-                        caption = f"{pp.caption} {existing_caption}"
-                    elif action == 'Keep' and existing_caption:
-                        caption = existing_caption
+                if save_output:
+                    if save_executor is not None:
+                        # existing_pnginfo is shared between all images made from this input, so the background save gets its own copy
+                        save_futures.append(save_executor.submit(save_postprocessed_image, pp, outpath, basename, infotext, existing_pnginfo.copy(), forced_filename, suffix))
+                        if len(save_futures) > io_threads:
+                            save_futures.popleft().result()
                     else:
-                        caption = pp.caption
-
-                    caption = caption.strip()
-                    if caption:
-                        with open(caption_filename, "w", encoding="utf8") as file:
-                            file.write(caption)
-
-            if extras_mode != 2 or show_extras_results:
-                outputs.append(pp.image)
+                        save_postprocessed_image(pp, outpath, basename, infotext, existing_pnginfo, forced_filename, suffix)
+
+                if extras_mode != 2 or show_extras_results:
+                    outputs.append(pp.image)
+    finally:
+        if read_executor is not None:
+            read_executor.shutdown(wait=True, cancel_futures=True)
+        if save_executor is not None:
+            save_executor.shutdown(wait=True)
+
+    for future in save_futures:
+        future.result()
 
     devices.torch_gc()
     shared.state.end()
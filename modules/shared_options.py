@@ -389,6 +389,7 @@ options_templates.update(options_section(('postprocessing', "Postprocessing", "p
     'postprocessing_operation_order': OptionInfo([], "Postprocessing operation order", ui_components.DropdownMulti, lambda: {"choices": [x.name for x in shared_items.postprocessing_scripts()]}),
     'upscaling_max_images_in_cache': OptionInfo(5, "Maximum number of images in upscaling cache", gr.Slider, {"minimum": 0, "maximum": 10, "step": 1}),
     'postprocessing_existing_caption_action': OptionInfo("Ignore", "Action for existing captions", gr.Radio, {"choices": ["Ignore", "Keep", "Prepend", "Append"]}).info("when generating captions using postprocessing; Ignore = use generated; Keep = use original; Prepend/Append = combine both"),
+    'postprocessing_io_threads': OptionInfo(2, "Number of threads for reading and saving images in batch postprocessing", gr.Slider, {"minimum": 0, "maximum": 16, "step": 1}).info("images are read ahead and saved in the background while the next one is processed; saving and image-saved callbacks run on a background thread; set 0 if an extension misbehaves"),
 }))
 
 options_templates.update(options_section((None, "Hidden options"), {
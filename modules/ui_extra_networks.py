@@ -1,7 +1,9 @@
 import functools
 import os.path
+import string
 import urllib.parse
 from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Optional, Union
@@ -19,6 +21,8 @@ from modules.infotext_utils import image_from_url_text
 
 extra_pages = []
 allowed_dirs = set()
+allowed_dirs_prefixes = ()
+"""case-normalized absolute paths of allowed_dirs with a trailing separator, for fast prefix checks in fetch_file"""
 default_allowed_preview_extensions = ["png", "jpg", "jpeg", "webp", "gif"]
 
 @functools.cache
@@ -30,6 +34,43 @@ def allowed_preview_extensions():
     return allowed_preview_extensions_with_extra((shared.opts.samples_format, ))
 
 
+@functools.cache
+def compile_template(template: str) -> Optional[tuple]:
+    """Splits a str.format template into (literal, field_name) pairs so that it is only parsed once.
+
+    Returns:
+        Tuple of (literal, field_name) pairs; field_name is None for trailing text.
+        None if the template uses anything besides plain named fields, such as conversions or format specs.
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if format_spec or conversion or (field_name is not None and not field_name.isidentifier()):
+            return None
+
+        segments.append((literal, field_name))
+
+    return tuple(segments)
+
+
+@functools.cache
+def template_fields(template: str) -> Optional[frozenset]:
+    """Names of the fields used by a str.format template, or None if they can't be determined from compile_template."""
+    segments = compile_template(template)
+    if segments is None:
+        return None
+
+    return frozenset(field_name for _, field_name in segments if field_name is not None)
+
+
+def render_template(template: str, args: dict) -> str:
+    """Equivalent of template.format(**args) using the template's cached compile_template segments."""
+    segments = compile_template(template)
+    if segments is None:
+        return template.format(**args)
+
+    return "".join([literal if field_name is None else literal + str(args[field_name]) for literal, field_name in segments])
+
+
 @dataclass
 class ExtraNetworksItem:
     """Wrapper for dictionaries representing ExtraNetworks items."""
@@ -50,24 +91,20 @@ def get_tree(paths: Union[str, list[str]], items: dict[str, ExtraNetworksItem])
     if isinstance(paths, (str,)):
         paths = [paths]
 
-    def _get_tree(_paths: list[str], _root: str):
+    def _get_tree(_path: str, _root: str):
         _res = {}
-        for path in _paths:
-            relpath = os.path.relpath(path, _root)
-            if os.path.isdir(path):
-                dir_items = os.listdir(path)
-                # Ignore empty directories.
-                if not dir_items:
-                    continue
-                dir_tree = _get_tree([os.path.join(path, x) for x in dir_items], _root)
-                # We only want to store non-empty folders in the tree.
-                if dir_tree:
-                    _res[relpath] = dir_tree
-            else:
-                if path not in items:
-                    continue
-                # Add the ExtraNetworksItem to the result.
-                _res[relpath] = items[path]
+        # scandir yields entries with cached file types, so there is no extra stat per child.
+        with os.scandir(_path) as entries:
+            for entry in entries:
+                relpath = os.path.relpath(entry.path, _root)
+                if entry.is_dir():
+                    dir_tree = _get_tree(entry.path, _root)
+                    # We only want to store non-empty folders in the tree.
+                    if dir_tree:
+                        _res[relpath] = dir_tree
+                elif entry.path in items:
+                    # Add the ExtraNetworksItem to the result.
+                    _res[relpath] = items[entry.path]
         return _res
 
     res = {}
@@ -78,14 +115,64 @@ def get_tree(paths: Union[str, list[str]], items: dict[str, ExtraNetworksItem])
     for path in paths:
         root = os.path.dirname(path)
         relpath = os.path.relpath(path, root)
-        # Wrap the path in a list since that is what the `_get_tree` expects.
-        res[relpath] = _get_tree([path], root)
-        if res[relpath]:
-            # We need to pull the inner path out one for these root dirs.
-            res[relpath] = res[relpath][relpath]
+        res[relpath] = _get_tree(path, root) if os.path.isdir(path) else {}
 
     return res
 
+
+def mtime_ns_or_none(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.cache
+def list_subdirs(parentdirs: tuple[str, ...], parentdirs_mtimes: tuple[Optional[int], ...], dir_button_function: bool, show_hidden_directories: bool) -> tuple[str, ...]:
+    """Lists subdirectories of parentdirs as they are shown in the dirs view.
+
+    Results are cached; parentdirs_mtimes is only part of the cache key, so that adding or removing
+    a top-level directory invalidates the entry. The cache is cleared when the user refreshes pages.
+
+    Returns:
+        Tuple of subdirectory labels, starting with "" (all) if there are any.
+    """
+    sort_key = functools.lru_cache(maxsize=None)(shared.natural_sort_key)
+
+    subdirs = {}
+    for parentdir in parentdirs:
+        for root, dirs, _ in sorted(os.walk(parentdir, followlinks=True), key=lambda x: sort_key(x[0])):
+            for dirname in sorted(dirs, key=sort_key):
+                x = os.path.join(root, dirname)
+
+                if not os.path.isdir(x):
+                    continue
+
+                subdir = os.path.abspath(x)[len(parentdir):]
+
+                if dir_button_function:
+                    if not subdir.startswith(os.path.sep):
+                        subdir = os.path.sep + subdir
+                else:
+                    while subdir.startswith(os.path.sep):
+                        subdir = subdir[1:]
+
+                with os.scandir(x) as it:
+                    is_empty = next(it, None) is None
+                if not is_empty and not subdir.endswith(os.path.sep):
+                    subdir = subdir + os.path.sep
+
+                if (os.path.sep + "." in subdir or subdir.startswith(".")) and not show_hidden_directories:
+                    continue
+
+                subdirs[subdir] = 1
+
+    if subdirs:
+        subdirs = {"": 1, **subdirs}
+
+    return tuple(subdirs)
+
+
 def register_page(page):
     """registers extra networks page for the UI; recommend doing it in on_before_ui() callback for extensions"""
 
@@ -93,6 +180,9 @@ def register_page(page):
     allowed_dirs.clear()
     allowed_dirs.update(set(sum([x.allowed_directories_for_previews() for x in extra_pages], [])))
 
+    global allowed_dirs_prefixes
+    allowed_dirs_prefixes = tuple(os.path.normcase(os.path.join(os.path.abspath(x), "")) for x in allowed_dirs)
+
 
 def fetch_file(filename: str = ""):
     from starlette.responses import FileResponse
@@ -100,7 +190,7 @@ def fetch_file(filename: str = ""):
     if not os.path.isfile(filename):
         raise HTTPException(status_code=404, detail="File not found")
 
-    if not any(Path(x).absolute() in Path(filename).absolute().parents for x in allowed_dirs):
+    if not os.path.normcase(os.path.abspath(filename)).startswith(allowed_dirs_prefixes):
         raise ValueError(f"File cannot be fetched: {filename}. Must be in one of directories registered by extra pages.")
 
     ext = os.path.splitext(filename)[1].lower()[1:]
@@ -178,9 +268,8 @@ def add_pages_to_demo(app):
 
 
 def quote_js(s):
-    s = s.replace('\\', '\\\\')
-    s = s.replace('"', '\\"')
-    return f'"{s}"'
+    # json string quoting is valid JS string quoting, and it also escapes control characters
+    return json.dumps(s, ensure_ascii=False)
 
 
 class ExtraNetworksPage:
@@ -217,9 +306,10 @@ class ExtraNetworksPage:
 
         item["user_metadata"] = metadata
 
-    def link_preview(self, filename):
+    def link_preview(self, filename, mtime=None):
         quoted_filename = urllib.parse.quote(filename.replace('\\', '/'))
-        mtime, _ = self.lister.mctime(filename)
+        if mtime is None:
+            mtime, _ = self.lister.mctime(filename)
         return f"./sd_extra_networks/thumb?filename={quoted_filename}&mtime={mtime}"
 
     def search_terms_from_path(self, filename, possible_directories=None):
@@ -231,11 +321,56 @@ class ExtraNetworksPage:
 
         return ""
 
+    def is_default(self, *names: str) -> bool:
+        """Checks whether none of the named methods are overridden by a subclass.
+
+        Pages from extensions may override the HTML generation methods with their original signatures,
+        so the optional arguments for sharing work between items are only passed to the default implementations.
+        """
+        return all(getattr(type(self), name) is getattr(ExtraNetworksPage, name) for name in names)
+
+    def create_item_html_shared_args(self, tabname: str) -> dict:
+        """Computes the parts of create_item_html output that are the same for every item of this page.
+
+        Callers rendering many items should compute this once and pass it to create_item_html.
+
+        Args:
+            tabname: The name of the active tab.
+
+        Returns:
+            A dictionary of precomputed values.
+        """
+        style_height = f"height: {shared.opts.extra_networks_card_height}px;" if shared.opts.extra_networks_card_height else ''
+        style_width = f"width: {shared.opts.extra_networks_card_width}px;" if shared.opts.extra_networks_card_width else ''
+        style_font_size = f"font-size: {shared.opts.extra_networks_card_text_scale*100}%;"
+
+        return {
+            "card_style": style_height + style_width + style_font_size,
+            "allow_neg": str(self.allow_negative_prompt).lower(),
+            "btn_metadata": self.btn_metadata_tpl.format(
+                **{
+                    "extra_networks_tabname": self.extra_networks_tabname,
+                }
+            ),
+            "btn_edit_item": self.btn_edit_item_tpl.format(
+                **{
+                    "tabname": tabname,
+                    "extra_networks_tabname": self.extra_networks_tabname,
+                }
+            ),
+            "show_desc": shared.opts.extra_networks_card_show_desc,
+            "description_is_html": shared.opts.extra_networks_card_description_is_html,
+            "hidden_models": shared.opts.extra_networks_hidden_models,
+            "abs_preview_dirs": [os.path.abspath(x) for x in self.allowed_directories_for_previews()],
+        }
+
     def create_item_html(
         self,
         tabname: str,
         item: dict,
         template: Optional[str] = None,
+        *,
+        shared_args: Optional[dict] = None,
     ) -> Union[str, dict]:
         """Generates HTML for a single ExtraNetworks Item.
 
@@ -243,110 +378,108 @@ class ExtraNetworksPage:
             tabname: The name of the active tab.
             item: Dictionary containing item information.
             template: Optional template string to use.
+            shared_args: Optional result of create_item_html_shared_args for this tab.
 
         Returns:
             If a template is passed: HTML string generated for this item.
                 Can be empty if the item is not meant to be shown.
             If no template is passed: A dictionary containing the generated item's attributes.
         """
-        preview = item.get("preview", None)
-        style_height = f"height: {shared.opts.extra_networks_card_height}px;" if shared.opts.extra_networks_card_height else ''
-        style_width = f"width: {shared.opts.extra_networks_card_width}px;" if shared.opts.extra_networks_card_width else ''
-        style_font_size = f"font-size: {shared.opts.extra_networks_card_text_scale*100}%;"
-        card_style = style_height + style_width + style_font_size
-        background_image = f'<img src="{html.escape(preview)}" class="preview" loading="lazy">' if preview else ''
-
-        onclick = item.get("onclick", None)
-        if onclick is None:
-            # Don't quote prompt/neg_prompt since they are stored as js strings already.
-            onclick_js_tpl = "cardClicked('{tabname}', {prompt}, {neg_prompt}, {allow_neg});"
-            onclick = onclick_js_tpl.format(
-                **{
-                    "tabname": tabname,
-                    "prompt": item["prompt"],
-                    "neg_prompt": item.get("negative_prompt", "''"),
-                    "allow_neg": str(self.allow_negative_prompt).lower(),
-                }
-            )
-            onclick = html.escape(onclick)
-
-        btn_copy_path = self.btn_copy_path_tpl.format(**{"filename": item["filename"]})
-        btn_metadata = ""
-        metadata = item.get("metadata")
-        if metadata:
-            btn_metadata = self.btn_metadata_tpl.format(
-                **{
-                    "extra_networks_tabname": self.extra_networks_tabname,
-                }
-            )
-        btn_edit_item = self.btn_edit_item_tpl.format(
-            **{
-                "tabname": tabname,
-                "extra_networks_tabname": self.extra_networks_tabname,
-            }
-        )
+        if shared_args is None:
+            shared_args = self.create_item_html_shared_args(tabname)
 
         local_path = ""
         filename = item.get("filename", "")
-        for reldir in self.allowed_directories_for_previews():
-            absdir = os.path.abspath(reldir)
-
+        for absdir in shared_args["abs_preview_dirs"]:
             if filename.startswith(absdir):
                 local_path = filename[len(absdir):]
 
         # if this is true, the item must not be shown in the default view, and must instead only be
         # shown when searching for it
-        if shared.opts.extra_networks_hidden_models == "Always":
+        if shared_args["hidden_models"] == "Always":
             search_only = False
         else:
             search_only = "/." in local_path or "\\." in local_path
 
-        if search_only and shared.opts.extra_networks_hidden_models == "Never":
+        if search_only and shared_args["hidden_models"] == "Never":
             return ""
 
-        sort_keys = " ".join(
-            [
-                f'data-sort-{k}="{html.escape(str(v))}"'
-                for k, v in item.get("sort_keys", {}).items()
-            ]
-        ).strip()
-
-        search_terms_html = ""
-        search_term_template = "<span class='hidden {class}'>{search_term}</span>"
-        for search_term in item.get("search_terms", []):
-            search_terms_html += search_term_template.format(
-                **{
-                    "class": f"search_terms{' search_only' if search_only else ''}",
-                    "search_term": search_term,
-                }
-            )
-
-        description = (item.get("description", "") or "" if shared.opts.extra_networks_card_show_desc else "")
-        if not shared.opts.extra_networks_card_description_is_html:
-            description = html.escape(description)
+        # Only compute the fields the template uses; without a template, the caller gets all of them.
+        fields = template_fields(template) if template else None
 
         # Some items here might not be used depending on HTML template used.
         args = {
-            "background_image": background_image,
-            "card_clicked": onclick,
-            "copy_path_button": btn_copy_path,
-            "description": description,
-            "edit_button": btn_edit_item,
-            "local_preview": quote_js(item["local_preview"]),
-            "metadata_button": btn_metadata,
-            "name": html.escape(item["name"]),
+            "edit_button": shared_args["btn_edit_item"],
+            "metadata_button": shared_args["btn_metadata"] if item.get("metadata") else "",
             "prompt": item.get("prompt", None),
-            "save_card_preview": html.escape(f"return saveCardPreview(event, '{tabname}', '{item['local_preview']}');"),
             "search_only": " search_only" if search_only else "",
-            "search_terms": search_terms_html,
-            "sort_keys": sort_keys,
-            "style": card_style,
+            "style": shared_args["card_style"],
             "tabname": tabname,
             "extra_networks_tabname": self.extra_networks_tabname,
         }
 
+        if fields is None or "background_image" in fields:
+            preview = item.get("preview", None)
+            args["background_image"] = f'<img src="{html.escape(preview)}" class="preview" loading="lazy">' if preview else ''
+
+        if fields is None or "card_clicked" in fields:
+            onclick = item.get("onclick", None)
+            if onclick is None:
+                # Don't quote prompt/neg_prompt since they are stored as js strings already.
+                onclick_js_tpl = "cardClicked('{tabname}', {prompt}, {neg_prompt}, {allow_neg});"
+                onclick = onclick_js_tpl.format(
+                    **{
+                        "tabname": tabname,
+                        "prompt": item["prompt"],
+                        "neg_prompt": item.get("negative_prompt", "''"),
+                        "allow_neg": shared_args["allow_neg"],
+                    }
+                )
+                onclick = html.escape(onclick)
+            args["card_clicked"] = onclick
+
+        if fields is None or "copy_path_button" in fields:
+            args["copy_path_button"] = self.btn_copy_path_tpl.format(**{"filename": item["filename"]})
+
+        if fields is None or "sort_keys" in fields:
+            args["sort_keys"] = " ".join(
+                [
+                    f'data-sort-{k}="{html.escape(str(v))}"'
+                    for k, v in item.get("sort_keys", {}).items()
+                ]
+            ).strip()
+
+        if fields is None or "search_terms" in fields:
+            search_term_template = "<span class='hidden {class}'>{search_term}</span>"
+            args["search_terms"] = "".join(
+                [
+                    search_term_template.format(
+                        **{
+                            "class": f"search_terms{' search_only' if search_only else ''}",
+                            "search_term": search_term,
+                        }
+                    )
+                    for search_term in item.get("search_terms", [])
+                ]
+            )
+
+        if fields is None or "description" in fields:
+            description = (item.get("description", "") or "" if shared_args["show_desc"] else "")
+            if not shared_args["description_is_html"]:
+                description = html.escape(description)
+            args["description"] = description
+
+        if fields is None or "name" in fields:
+            args["name"] = html.escape(item["name"])
+
+        if fields is None or "local_preview" in fields:
+            args["local_preview"] = quote_js(item["local_preview"])
+
+        if fields is None or "save_card_preview" in fields:
+            args["save_card_preview"] = html.escape(f"return saveCardPreview(event, '{tabname}', '{item['local_preview']}');")
+
         if template:
-            return template.format(**args)
+            return render_template(template, args)
         else:
             return args
 
@@ -379,8 +512,9 @@ class ExtraNetworksPage:
         if not content:
             return None
 
-        btn = self.btn_tree_tpl.format(
-            **{
+        btn = render_template(
+            self.btn_tree_tpl,
+            {
                 "search_terms": "",
                 "subclass": "tree-list-content-dir",
                 "tabname": tabname,
@@ -402,7 +536,7 @@ class ExtraNetworksPage:
             "</li>"
         )
 
-    def create_tree_file_item_html(self, tabname: str, file_path: str, item: dict) -> str:
+    def create_tree_file_item_html(self, tabname: str, file_path: str, item: dict, *, shared_args: Optional[dict] = None, item_html_args: Optional[dict] = None) -> str:
         """Generates HTML for a file item in the tree.
 
         The generated HTML is of the format:
@@ -417,11 +551,17 @@ class ExtraNetworksPage:
             tabname: The name of the active tab.
             file_path: The path to the file for this item.
             item: Dictionary containing the item information.
+            shared_args: Optional result of create_item_html_shared_args for this tab.
+            item_html_args: Optional precomputed result of create_item_html for this item.
 
         Returns:
             HTML formatted string.
         """
-        item_html_args = self.create_item_html(tabname, item)
+        if item_html_args is None:
+            if self.is_default("create_item_html"):
+                item_html_args = self.create_item_html(tabname, item, shared_args=shared_args)
+            else:
+                item_html_args = self.create_item_html(tabname, item)
         action_buttons = "".join(
             [
                 item_html_args["copy_path_button"],
@@ -430,8 +570,9 @@ class ExtraNetworksPage:
             ]
         )
         action_buttons = f"<div class=\"button-row\">{action_buttons}</div>"
-        btn = self.btn_tree_tpl.format(
-            **{
+        btn = render_template(
+            self.btn_tree_tpl,
+            {
                 "search_terms": "",
                 "subclass": "tree-list-content-file",
                 "tabname": tabname,
@@ -452,24 +593,33 @@ class ExtraNetworksPage:
             "</li>"
         )
 
-    def create_tree_view_html(self, tabname: str) -> str:
+    def create_tree_view_html(self, tabname: str, *, item_args: Optional[dict[str, dict]] = None, tree_items: Optional[dict[str, ExtraNetworksItem]] = None) -> str:
         """Generates HTML for displaying folders in a tree view.
 
         Args:
             tabname: The name of the active tab.
+            item_args: Optional dictionary associating item names to their precomputed create_item_html results.
+            tree_items: Optional dictionary associating filepaths to ExtraNetworksItem wrappers of self.items.
 
         Returns:
             HTML string generated for this tree view.
         """
-        res = ""
+        res = []
 
         # Setup the tree dictionary.
         roots = self.allowed_directories_for_previews()
-        tree_items = {v["filename"]: ExtraNetworksItem(v) for v in self.items.values()}
+        if tree_items is None:
+            tree_items = {v["filename"]: ExtraNetworksItem(v) for v in self.items.values()}
         tree = get_tree([os.path.abspath(x) for x in roots], items=tree_items)
 
         if not tree:
-            return res
+            return ""
+
+        shared_args = self.create_item_html_shared_args(tabname)
+        pass_shared_args = self.is_default("create_tree_file_item_html")
+
+        # One memoized key function for the whole render, shared by every level of the recursion.
+        sort_key = functools.lru_cache(maxsize=None)(shared.natural_sort_key)
 
         def _build_tree(data: Optional[dict[str, ExtraNetworksItem]] = None) -> Optional[str]:
             """Recursively builds HTML for a tree.
@@ -490,9 +640,13 @@ class ExtraNetworksPage:
             _dir_li = []
             _file_li = []
 
-            for k, v in sorted(data.items(), key=lambda x: shared.natural_sort_key(x[0])):
+            for k, v in sorted(data.items(), key=lambda x: sort_key(x[0])):
                 if isinstance(v, (ExtraNetworksItem,)):
-                    _file_li.append(self.create_tree_file_item_html(tabname, k, v.item))
+                    if pass_shared_args:
+                        item_html_args = item_args[v.item["name"]] if item_args is not None else None
+                        _file_li.append(self.create_tree_file_item_html(tabname, k, v.item, shared_args=shared_args, item_html_args=item_html_args))
+                    else:
+                        _file_li.append(self.create_tree_file_item_html(tabname, k, v.item))
                 else:
                     _dir_li.append(self.create_tree_dir_item_html(tabname, k, _build_tree(v)))
 
@@ -500,46 +654,24 @@ class ExtraNetworksPage:
             return "".join(_dir_li) + "".join(_file_li)
 
         # Add each root directory to the tree.
-        for k, v in sorted(tree.items(), key=lambda x: shared.natural_sort_key(x[0])):
+        for k, v in sorted(tree.items(), key=lambda x: sort_key(x[0])):
             item_html = self.create_tree_dir_item_html(tabname, k, _build_tree(v))
             # Only add non-empty entries to the tree.
             if item_html is not None:
-                res += item_html
+                res.append(item_html)
 
-        return f"<ul class='tree-list tree-list--tree'>{res}</ul>"
+        return f"<ul class='tree-list tree-list--tree'>{''.join(res)}</ul>"
 
     def create_dirs_view_html(self, tabname: str) -> str:
         """Generates HTML for displaying folders."""
 
-        subdirs = {}
-        for parentdir in [os.path.abspath(x) for x in self.allowed_directories_for_previews()]:
-            for root, dirs, _ in sorted(os.walk(parentdir, followlinks=True), key=lambda x: shared.natural_sort_key(x[0])):
-                for dirname in sorted(dirs, key=shared.natural_sort_key):
-                    x = os.path.join(root, dirname)
-
-                    if not os.path.isdir(x):
-                        continue
-
-                    subdir = os.path.abspath(x)[len(parentdir):]
-
-                    if shared.opts.extra_networks_dir_button_function:
-                        if not subdir.startswith(os.path.sep):
-                            subdir = os.path.sep + subdir
-                    else:
-                        while subdir.startswith(os.path.sep):
-                            subdir = subdir[1:]
-
-                    is_empty = len(os.listdir(x)) == 0
-                    if not is_empty and not subdir.endswith(os.path.sep):
-                        subdir = subdir + os.path.sep
-
-                    if (os.path.sep + "." in subdir or subdir.startswith(".")) and not shared.opts.extra_networks_show_hidden_directories:
-                        continue
-
-                    subdirs[subdir] = 1
-
-        if subdirs:
-            subdirs = {"": 1, **subdirs}
+        parentdirs = tuple(os.path.abspath(x) for x in self.allowed_directories_for_previews())
+        subdirs = list_subdirs(
+            parentdirs,
+            tuple(mtime_ns_or_none(x) for x in parentdirs),
+            shared.opts.extra_networks_dir_button_function,
+            shared.opts.extra_networks_show_hidden_directories,
+        )
 
         subdirs_html = "".join([f"""
         <button class='lg secondary gradio-button custom-button{" search-all" if subdir == "" else ""}' onclick='extraNetworksSearchButton("{tabname}", "{self.extra_networks_tabname}", event)'>
@@ -549,7 +681,7 @@ class ExtraNetworksPage:
 
         return subdirs_html
 
-    def create_card_view_html(self, tabname: str, *, none_message) -> str:
+    def create_card_view_html(self, tabname: str, *, none_message, item_args: Optional[dict[str, dict]] = None) -> str:
         """Generates HTML for the network Card View section for a tab.
 
         This HTML goes into the `extra-networks-pane.html` <div> with
@@ -558,13 +690,23 @@ class ExtraNetworksPage:
         Args:
             tabname: The name of the active tab.
             none_message: HTML text to show when there are no cards.
+            item_args: Optional dictionary associating item names to their precomputed create_item_html results.
 
         Returns:
             HTML formatted string.
         """
         res = []
-        for item in self.items.values():
-            res.append(self.create_item_html(tabname, item, self.card_tpl))
+        if item_args is not None:
+            for name in self.items:
+                args = item_args[name]
+                res.append(render_template(self.card_tpl, args) if args else "")
+        elif self.is_default("create_item_html"):
+            shared_args = self.create_item_html_shared_args(tabname)
+            for item in self.items.values():
+                res.append(self.create_item_html(tabname, item, self.card_tpl, shared_args=shared_args))
+        else:
+            for item in self.items.values():
+                res.append(self.create_item_html(tabname, item, self.card_tpl))
 
         if not res:
             dirs = "".join([f"<li>{x}</li>" for x in self.allowed_directories_for_previews()])
@@ -596,10 +738,24 @@ class ExtraNetworksPage:
             if metadata:
                 self.metadata[item["name"]] = metadata
 
-            if "user_metadata" not in item:
-                self.read_user_metadata(item)
+        # User metadata is a json file per item; read the missing ones in parallel since this is bound by disk access.
+        items_without_user_metadata = [item for item in self.items.values() if "user_metadata" not in item]
+        if items_without_user_metadata:
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(self.read_user_metadata, items_without_user_metadata))
 
         show_tree = shared.opts.extra_networks_tree_view_default_enabled
+        use_tree_view = shared.opts.extra_networks_tree_view_style == "Tree"
+
+        # The tree view uses the full set of item fields anyway, so compute them once and render cards from them too.
+        card_view_kwargs = {}
+        tree_view_kwargs = {}
+        if use_tree_view and self.is_default("create_item_html", "create_card_view_html", "create_tree_view_html"):
+            shared_args = self.create_item_html_shared_args(tabname)
+            item_args = {name: self.create_item_html(tabname, item, shared_args=shared_args) for name, item in self.items.items()}
+            tree_items = {v["filename"]: ExtraNetworksItem(v) for v in self.items.values()}
+            card_view_kwargs = {"item_args": item_args}
+            tree_view_kwargs = {"item_args": item_args, "tree_items": tree_items}
 
         page_params = {
             "tabname": tabname,
@@ -610,13 +766,13 @@ class ExtraNetworksPage:
             "sort_date_created_active": ' extra-network-control--enabled' if shared.opts.extra_networks_card_order_field == 'Date Created' else '',
             "sort_date_modified_active": ' extra-network-control--enabled' if shared.opts.extra_networks_card_order_field == 'Date Modified' else '',
             "tree_view_btn_extra_class": "extra-network-control--enabled" if show_tree else "",
-            "items_html": self.create_card_view_html(tabname, none_message="Loading..." if empty else None),
+            "items_html": self.create_card_view_html(tabname, none_message="Loading..." if empty else None, **card_view_kwargs),
             "extra_networks_tree_view_default_width": shared.opts.extra_networks_tree_view_default_width,
             "tree_view_div_default_display_class": "" if show_tree else "extra-network-dirs-hidden",
         }
 
-        if shared.opts.extra_networks_tree_view_style == "Tree":
-            pane_content = self.pane_content_tree_tpl.format(**page_params, tree_html=self.create_tree_view_html(tabname))
+        if use_tree_view:
+            pane_content = self.pane_content_tree_tpl.format(**page_params, tree_html=self.create_tree_view_html(tabname, **tree_view_kwargs))
         else:
             pane_content = self.pane_content_dirs_tpl.format(**page_params, dirs_html=self.create_dirs_view_html(tabname))
 
@@ -652,8 +808,9 @@ class ExtraNetworksPage:
         potential_files = sum([[f"{path}.{ext}", f"{path}.preview.{ext}"] for ext in allowed_preview_extensions()], [])
 
         for file in potential_files:
-            if self.lister.exists(file):
-                return self.link_preview(file)
+            stats = self.lister.find(file)
+            if stats is not None:
+                return self.link_preview(file, mtime=stats[1])
 
         return None
 
@@ -771,6 +928,7 @@ def create_ui(interface: gr.Blocks, unrelated_tabs, tabname):
         tab.select(fn=None, _js=jscode, inputs=[], outputs=[], show_progress=False)
 
         def refresh():
+            list_subdirs.cache_clear()
             for pg in ui.stored_extra_pages:
                 pg.refresh()
             create_html()
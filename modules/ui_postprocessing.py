@@ -31,12 +31,13 @@ def create_ui():
 
             output_panel = ui_common.create_output_panel("extras", shared.opts.outdir_extras_samples)
 
-    tab_single.select(fn=lambda: 0, inputs=[], outputs=[tab_index])
-    tab_batch.select(fn=lambda: 1, inputs=[], outputs=[tab_index])
-    tab_batch_dir.select(fn=lambda: 2, inputs=[], outputs=[tab_index])
+    # constant tab indices are set on the client, without a round trip to the server
+    tab_single.select(fn=None, _js="() => 0", inputs=[], outputs=[tab_index], show_progress=False)
+    tab_batch.select(fn=None, _js="() => 1", inputs=[], outputs=[tab_index], show_progress=False)
+    tab_batch_dir.select(fn=None, _js="() => 2", inputs=[], outputs=[tab_index], show_progress=False)
 
     submit.click(
-        fn=call_queue.wrap_gradio_gpu_call(postprocessing.run_postprocessing_webui, extra_outputs=[None, '']),
+        fn=call_queue.wrap_gradio_gpu_call(postprocessing.run_postprocessing_webui, extra_outputs=[None, ''], run_async=True),
         _js="submit_extras",
         inputs=[
             dummy_component,
@@ -58,7 +59,8 @@ def create_ui():
 
     parameters_copypaste.add_paste_fields("extras", extras_image, None)
 
+    # collapses bursts of changes, such as from drag and drop or pasting, into a single call
     extras_image.change(
-        fn=scripts.scripts_postproc.image_changed,
+        fn=call_queue.debounce(scripts.scripts_postproc.image_changed, 0.05),
         inputs=[], outputs=[]
     )
@@ -10,8 +10,11 @@ def natural_sort_key(s, regex=re.compile('([0-9]+)')):
 
 
 def listfiles(dirname):
-    filenames = [os.path.join(dirname, x) for x in sorted(os.listdir(dirname), key=natural_sort_key) if not x.startswith(".")]
-    return [file for file in filenames if os.path.isfile(file)]
+    # DirEntry.is_file() uses the file type from the directory listing, so there is no extra stat call per file
+    with os.scandir(dirname) as it:
+        entries = [entry for entry in it if not entry.name.startswith(".") and entry.is_file()]
+
+    return [entry.path for entry in sorted(entries, key=lambda entry: natural_sort_key(entry.name))]
 
 
 def html_path(filename):
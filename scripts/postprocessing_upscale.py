@@ -11,6 +11,8 @@ from modules.ui import switch_values_symbol
 
 upscale_cache = {}
 
+re_upscaler_scale = re.compile(r'(\d)[xX]|[xX](\d)')
+
 
 def limit_size_by_one_dimention(w, h, limit):
     if h > w and h > limit:
@@ -56,21 +58,25 @@ class ScriptPostprocessingUpscale(scripts_postprocessing.ScriptPostprocessing):
                                 upscaling_res_switch_btn = ToolButton(value=switch_values_symbol, elem_id="upscaling_res_switch_btn", tooltip="Switch width/height")
                                 upscaling_crop = gr.Checkbox(label='Crop to fit', value=True, elem_id="extras_upscaling_crop")
 
-        def on_selected_upscale_method(upscale_method):
+        def on_selected_upscale_method(upscale_method, current_scale):
             if not shared.opts.set_scale_by_when_changing_upscaler:
                 return gr.update()
 
-            match = re.search(r'(\d)[xX]|[xX](\d)', upscale_method)
+            match = re_upscaler_scale.search(upscale_method)
             if not match:
                 return gr.update()
 
-            return gr.update(value=int(match.group(1) or match.group(2)))
+            scale = int(match.group(1) or match.group(2))
+            if scale == current_scale:
+                return gr.update()
+
+            return gr.update(value=scale)
 
         upscaling_res_switch_btn.click(lambda w, h: (h, w), inputs=[upscaling_resize_w, upscaling_resize_h], outputs=[upscaling_resize_w, upscaling_resize_h], show_progress=False)
         tab_scale_by.select(fn=lambda: 0, inputs=[], outputs=[selected_tab])
         tab_scale_to.select(fn=lambda: 1, inputs=[], outputs=[selected_tab])
 
-        extras_upscaler_1.change(on_selected_upscale_method, inputs=[extras_upscaler_1], outputs=[upscaling_resize], show_progress="hidden")
+        extras_upscaler_1.change(on_selected_upscale_method, inputs=[extras_upscaler_1, upscaling_resize], outputs=[upscaling_resize], show_progress="hidden")
 
         return {
             "upscale_enabled": upscale_enabled,
@@ -136,7 +142,7 @@ class ScriptPostprocessingUpscale(scripts_postprocessing.ScriptPostprocessing):
         if upscaler_1_name == "None":
             upscaler_1_name = None
 
-        upscaler1 = next(iter([x for x in shared.sd_upscalers if x.name == upscaler_1_name]), None)
+        upscaler1 = next((x for x in shared.sd_upscalers if x.name == upscaler_1_name), None)
         assert upscaler1 or (upscaler_1_name is None), f'could not find upscaler named {upscaler_1_name}'
 
         if not upscaler1:
@@ -146,7 +152,7 @@ class ScriptPostprocessingUpscale(scripts_postprocessing.ScriptPostprocessing):
         if upscaler_2_name == "None":
             upscaler_2_name = None
 
-        upscaler2 = next(iter([x for x in shared.sd_upscalers if x.name == upscaler_2_name and x.name != "None"]), None)
+        upscaler2 = next((x for x in shared.sd_upscalers if x.name == upscaler_2_name and x.name != "None"), None)
         assert upscaler2 or (upscaler_2_name is None), f'could not find upscaler named {upscaler_2_name}'
 
         upscaled_image = self.upscale(pp.image, pp.info, upscaler1, upscale_mode, upscale_by, max_side_length, upscale_to_width, upscale_to_height, upscale_crop)
@@ -188,7 +194,7 @@ class ScriptPostprocessingUpscaleSimple(ScriptPostprocessingUpscale):
         if upscaler_name is None or upscaler_name == "None":
             return
 
-        upscaler1 = next(iter([x for x in shared.sd_upscalers if x.name == upscaler_name]), None)
+        upscaler1 = next((x for x in shared.sd_upscalers if x.name == upscaler_name), None)
         assert upscaler1, f'could not find upscaler named {upscaler_name}'
 
         pp.image = self.upscale(pp.image, pp.info, upscaler1, 0, upscale_by, 0, 0, 0, False)